@@ -3,28 +3,53 @@
 Main module of CPC-API containing access classes to the API.
 """
 from io import BytesIO
+import asyncio
+import unicodedata
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import aiohttp
 import numpy as np
 from functools import wraps
 import imageio
+import orjson
 import requests
-import warnings
+import requests_cache
+from requests.adapters import HTTPAdapter
+from collections.abc import Sequence
 from typing import List
-
-with warnings.catch_warnings():
-    warnings.filterwarnings("ignore", category=UserWarning)
-    from fuzzywuzzy.process import extractBests
+from rapidfuzz import fuzz
+from rapidfuzz.process import cdist, extract, extractOne
+from rapidfuzz.utils import default_process
 
 
 __all__ = ['CPCApi', 'Parliamentarian', 'Vote', 'Balloting']
 
 
 def memoize(f):
+    def key(self, args, kargs):
+        # the function is part of the key because all the memoized methods share the same cache.
+        # The instance is not: instances requesting the same website, given by base_url, share their results
+        if kargs:
+            return f, self.base_url, args, tuple(sorted(kargs.items()))
+        return f, self.base_url, args
+
     @wraps(f)
-    def aux(*args, **kargs):
-        k = (args, tuple(sorted(kargs.items())))
-        if k not in CPCApi.cache:
-            CPCApi.cache[k] = f(*args, **kargs)
-        return CPCApi.cache[k]
+    def aux(self, *args, **kargs):
+        k = key(self, args, kargs)
+        try:
+            return CPCApi.cache[k]
+        except KeyError:
+            pass
+        result = CPCApi.cache[k] = f(self, *args, **kargs)
+        return result
+
+    def is_cached(self, *args, **kargs):
+        """
+        Tells if the result of the memoized function for these arguments is already in the cache.
+        """
+        return key(self, args, kargs) in CPCApi.cache
+
+    aux.is_cached = is_cached
     return aux
 
 
@@ -36,8 +61,19 @@ class CPCApi(object):
     """
     format = 'json'
     cache = {}
-
-    def __init__(self, ptype='depute', legislature=None):
+    # Balloting objects shared by all the instances requesting the same website, by number
+    _ballotings_by_base_url = {}
+    # raw votes data and search caches, shared like the memoized results they are consumed by
+    _votes_data_by_base_url = {}
+    _search_data_by_base_url = {}
+    # http sessions shared by all the instances, by lifetime of the cached responses
+    _sessions_by_expire_after = {}
+    # (connect, read) timeouts in seconds of the requests sent to the API
+    timeout = (5, 30)
+    # number of parliamentarians sharing the most bigrams with a query that are scored by the fuzzy search
+    search_candidates = 30
+
+    def __init__(self, ptype='depute', legislature=None, expire_after=86400):
         """
         Parameters
         ----------
@@ -47,6 +83,9 @@ class CPCApi(object):
         legislature: Choice(['2007-2012', '2012-2017', '2017-2022', None])
             This string will be part of the urls when requesting the API. It allows to specify what legislature
             period you are interested into.
+        expire_after: Choice([int, None])
+            Number of seconds during which the responses of the website are kept in the on-disk http cache.
+            If None, the responses never expire. If 0, nothing is cached. (default: 86400, one day)
         """
 
         assert(ptype in ['depute', 'senateur'])
@@ -54,8 +93,82 @@ class CPCApi(object):
         self.legislature = legislature
         self.ptype = ptype
         self.ptype_plural = ptype + 's'
-        self.base_url = 'https://%s.nos%s.fr' % (legislature or 'www', self.ptype_plural)
-        self.dct_all_ballotings = dict()
+        self.base_url = f"https://{legislature or 'www'}.nos{self.ptype_plural}.fr"
+        # url of the votes of a parliamentarian, formatted with its slug
+        self._votes_url_tmpl = f'{self.base_url}/{{}}/votes/{self.format}'
+        self.dct_all_ballotings = type(self)._ballotings_by_base_url.setdefault(self.base_url, dict())
+        # a single session keeps the connections to the websites alive between requests
+        # and stores the responses on disk, so they are shared between instances and processes
+        self.session = type(self)._session(-1 if expire_after is None else expire_after)
+        # raw votes data fetched in advance by the bulk functions, consumed by self.parliamentarian_votes()
+        self._votes_data = type(self)._votes_data_by_base_url.setdefault(self.base_url, dict())
+        # preprocessed `field` strings and bigram indexes of the parliamentarians, used by the search functions
+        self._search_data = type(self)._search_data_by_base_url.setdefault(
+            self.base_url, dict(parls=None, processed_fields=dict(), ngram_indexes=dict()))
+
+    @classmethod
+    def _session(cls, expire_after: int) -> requests_cache.CachedSession:
+        """
+        Returns the session shared by all the instances keeping the responses for `expire_after` seconds.
+
+        The session is created on the first call and is never closed, like the other class level stores.
+
+        Parameters
+        ----------
+        expire_after: int
+            Number of seconds during which the responses are kept in the on-disk http cache. -1 means forever.
+
+        Returns
+        -------
+        requests_cache.CachedSession
+            The shared session.
+        """
+        try:
+            return cls._sessions_by_expire_after[expire_after]
+        except KeyError:
+            pass
+        session = requests_cache.CachedSession(cache_name='cpc_cache', backend='sqlite', use_cache_dir=True,
+                                               expire_after=expire_after)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        cls._sessions_by_expire_after[expire_after] = session
+        return session
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Sends a GET request to `url` through the session of this object.
+
+        Parameters
+        ----------
+        url: str
+            The requested url.
+        kwargs:
+            Other keyword arguments passed to `requests.Session.get`.
+
+        Returns
+        -------
+        requests.Response
+            The response of the website.
+        """
+        return self.session.get(url, timeout=self.timeout, **kwargs)
+
+    def _get_json(self, url: str):
+        """
+        Sends a GET request to `url` and decodes the json content of the response.
+
+        The raw bytes of the response are given to orjson, skipping the text decoding of `requests.Response.json`.
+
+        Parameters
+        ----------
+        url: str
+            The requested url.
+
+        Returns
+        -------
+        The decoded json data.
+        """
+        return orjson.loads(self._get(url).content)
 
     def synthese(self, month=None):
         """
@@ -81,9 +194,9 @@ class CPCApi(object):
         if month is None:
             month = 'data'
 
-        url = '%s/synthese/%s/%s' % (self.base_url, month, self.format)
+        url = f'{self.base_url}/synthese/{month}/{self.format}'
 
-        data = requests.get(url).json()
+        data = self._get_json(url)
         # todo should return a list of Parliamentarian objects
         return [depute[self.ptype] for depute in data[self.ptype_plural]]
 
@@ -102,9 +215,9 @@ class CPCApi(object):
         Parliamentarian
             Requested parliamentarian data object.
         """
-        url = '%s/%s/%s' % (self.base_url, slug_name, self.format)
+        url = f'{self.base_url}/{slug_name}/{self.format}'
         # todo there should be a mecanism to handle errors in case of bad slug name.
-        return Parliamentarian(requests.get(url).json()[self.ptype], self)
+        return Parliamentarian(self._get_json(url)[self.ptype], self)
 
     @memoize
     def picture(self, slug_name, pixels='60') -> np.ndarray:
@@ -123,7 +236,7 @@ class CPCApi(object):
         np.ndarray
             A 3D array representing the picture of the parliamentarian.
         """
-        return imageio.imread(BytesIO(requests.get(self.picture_url(slug_name, pixels=pixels)).content))
+        return imageio.imread(BytesIO(self._get(self.picture_url(slug_name, pixels=pixels)).content))
 
     def picture_url(self, slug_name, pixels='60') -> str:
         """
@@ -141,7 +254,7 @@ class CPCApi(object):
         str
             The url of the picture.
         """
-        return '%s/%s/photo/%s/%s' % (self.base_url, self.ptype, slug_name, pixels)
+        return f'{self.base_url}/{self.ptype}/photo/{slug_name}/{pixels}'
 
     @memoize
     def search(self, q: str, page: int = 1) -> dict:
@@ -163,8 +276,8 @@ class CPCApi(object):
         """
         # url = '%s/recherche/%s?page=%s&format=%s' % (self.base_url, q, page, 'csv')
         # not necessary because now the returned format is a valid json
-        url = '%s/recherche/%s?page=%s&format=%s' % (self.base_url, q, page, self.format)
-        return requests.get(url).json()
+        url = f'{self.base_url}/recherche/{q}?page={page}&format={self.format}'
+        return self._get_json(url)
 
     @memoize
     def parliamentarian_votes(self, p_slug: str) -> List:
@@ -181,25 +294,120 @@ class CPCApi(object):
         List[Vote]
             List of Vote objects from the parliamentarian.
         """
-        url = '%s/%s/%s/%s' % (self.base_url, p_slug, "votes", self.format)
-        data = requests.get(url).json()  # todo handle the error that may happen here
+        data = self._votes_data.pop(p_slug, None)
+        if data is None:
+            data = self._get_json(self._votes_url(p_slug))  # todo handle the error that may happen here
 
         lst_votes = []
         for dict_vote in data["votes"]:
             dict_vote = dict_vote["vote"]
             dict_balloting = dict_vote["scrutin"]
-            balloting = self.dct_all_ballotings[dict_balloting["numero"]] = \
-                self.dct_all_ballotings.get(dict_balloting["numero"], Balloting(dict_balloting))
+            balloting = self.dct_all_ballotings.get(dict_balloting["numero"])
+            if balloting is None:
+                balloting = self.dct_all_ballotings[dict_balloting["numero"]] = Balloting(dict_balloting)
             vote_obj = Vote(dict_vote, balloting)
             lst_votes.append(vote_obj)
 
         return lst_votes
 
+    def _votes_url(self, p_slug: str) -> str:
+        """
+        Returns the url to the votes of parliamentarian specified by `p_slug`.
+        """
+        return self._votes_url_tmpl.format(p_slug)
+
+    def _votes_to_fetch(self, slugs: List[str]) -> List[str]:
+        """
+        Returns the slugs of `slugs`, without duplicates, whose votes are neither memoized nor fetched in advance yet.
+        """
+        return [p_slug for p_slug in dict.fromkeys(slugs)
+                if p_slug not in self._votes_data and not CPCApi.parliamentarian_votes.is_cached(self, p_slug)]
+
+    async def parliamentarians_votes_bulk_async(self, slugs: List[str], max_concurrency: int = 8) -> dict:
+        """
+        Returns the votes of all the parliamentarians specified by `slugs`, fetching them concurrently.
+
+        The requests are sent at the same time (at most `max_concurrency` of them are pending at once),
+        then the Vote and Balloting objects are built one parliamentarian after the other,
+        as in self.parliamentarian_votes(). The votes already returned by self.parliamentarian_votes() are not
+        requested again.
+
+        Parameters
+        ----------
+        slugs: List[str]
+            The slugs of the parliamentarians.
+        max_concurrency: int
+            The maximum number of simultaneous requests. (default: 8)
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each slug to the list of Vote objects from the parliamentarian.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        timeout = aiohttp.ClientTimeout(connect=self.timeout[0], sock_read=self.timeout[1])
+
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async def fetch(p_slug):
+                async with semaphore:
+                    async with session.get(self._votes_url(p_slug)) as response:
+                        response.raise_for_status()
+                        return p_slug, orjson.loads(await response.read())
+
+            self._votes_data.update(await asyncio.gather(*(fetch(p_slug) for p_slug in self._votes_to_fetch(slugs))))
+
+        # objects are built serially because the ballotings are shared between parliamentarians
+        return {p_slug: self.parliamentarian_votes(p_slug) for p_slug in slugs}
+
+    def parliamentarians_votes_bulk(self, slugs: List[str], max_concurrency: int = 8) -> dict:
+        """
+        Synchronous version of self.parliamentarians_votes_bulk_async().
+
+        It can't be called from a running event loop: await self.parliamentarians_votes_bulk_async() instead.
+
+        Parameters
+        ----------
+        slugs: List[str]
+            The slugs of the parliamentarians.
+        max_concurrency: int
+            The maximum number of simultaneous requests. (default: 8)
+
+        Returns
+        -------
+        dict
+            A dictionary mapping each slug to the list of Vote objects from the parliamentarian.
+        """
+        return asyncio.run(self.parliamentarians_votes_bulk_async(slugs, max_concurrency=max_concurrency))
+
+    def prefetch_votes(self, slugs: List[str], max_workers: int = 8) -> None:
+        """
+        Fetches concurrently the votes of all the parliamentarians specified by `slugs`.
+
+        The requests are sent through the session of this object by a pool of `max_workers` threads.
+        Subsequent calls to self.parliamentarian_votes() on these slugs then don't request the website.
+        The votes already returned by self.parliamentarian_votes() are not requested again.
+
+        Parameters
+        ----------
+        slugs: List[str]
+            The slugs of the parliamentarians.
+        max_workers: int
+            The number of threads sending the requests. (default: 8)
+        """
+        def fetch(p_slug):
+            return p_slug, self._get_json(self._votes_url(p_slug))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self._votes_data.update(executor.map(fetch, self._votes_to_fetch(slugs)))
+
     @memoize
-    def parlementarians(self, active: bool = None) -> List:
+    def parlementarians(self, active: bool = None) -> Sequence:
         """
         Returns list of parliamentarians.
 
+        The Parliamentarian objects are only created when they are accessed, so that counting the parliamentarians
+        or looking at a few of them doesn't build all of them.
+
         Parameters
         ----------
         active: bool
@@ -207,18 +415,69 @@ class CPCApi(object):
 
         Returns
         -------
-        List[Parliamentarian]
+        Sequence[Parliamentarian]
             list of Parliamentarian objects.
         """
         if active is None:
-            url = '%s/%s/%s' % (self.base_url, self.ptype_plural, self.format)
+            url = f'{self.base_url}/{self.ptype_plural}/{self.format}'
         else:
-            url = '%s/%s/enmandat/%s' % (self.base_url, self.ptype_plural, self.format)
+            url = f'{self.base_url}/{self.ptype_plural}/enmandat/{self.format}'
 
-        data = requests.get(url).json()
-        return [Parliamentarian(depute[self.ptype], self) for depute in data[self.ptype_plural]]
+        data = self._get_json(url)
+        return _LazyParliamentarians([depute[self.ptype] for depute in data[self.ptype_plural]], self)
+
+    def _processed_field(self, field: str) -> List[str]:
+        """
+        Returns the preprocessed `field` attribute of each parliamentarian, in the order of self.parlementarians().
+
+        The strings are computed once per `field` and kept until the list of parliamentarians changes.
+
+        Parameters
+        ----------
+        field: str
+            A field (attribute) in the Parliamentarian objects returned by function self.parliamentarians().
+
+        Returns
+        -------
+        List[str]
+            The ASCII folded, lowercased and stripped values of `field`.
+        """
+        parls = self.parlementarians()
+        if parls is not self._search_data['parls']:
+            # the memoized list of parliamentarians has been recomputed: drop the stale strings
+            self._search_data.update(parls=parls, processed_fields=dict(), ngram_indexes=dict())
+        processed_fields = self._search_data['processed_fields']
+        if field not in processed_fields:
+            # the raw data is read so that no Parliamentarian object is created
+            processed_fields[field] = [_process(dict_parl[field]) for dict_parl in parls.lst_dict_parl]
+        return processed_fields[field]
+
+    def _ngram_index(self, field: str) -> dict:
+        """
+        Returns the bigram index of the preprocessed `field` attribute of the parliamentarians.
+
+        The index is built once per `field` and kept as long as the strings of self._processed_field().
+
+        Parameters
+        ----------
+        field: str
+            A field (attribute) in the Parliamentarian objects returned by function self.parliamentarians().
+
+        Returns
+        -------
+        Dict[str, Set[int]]
+            A dictionary mapping each bigram to the indices of the parliamentarians whose `field` contains it.
+        """
+        choices = self._processed_field(field)
+        ngram_indexes = self._search_data['ngram_indexes']
+        if field not in ngram_indexes:
+            index = dict()
+            for i, choice in enumerate(choices):
+                for bigram in _bigrams(choice):
+                    index.setdefault(bigram, set()).add(i)
+            ngram_indexes[field] = index
+        return ngram_indexes[field]
 
-    @memoize
     def search_parliamentarians(self, q: str, field: str = 'nom', limit: int = None, no_score: bool = True):
         """
         Finds a parliamentarian based on query `q` and attribute `field` in the list of parliamentarians.
@@ -241,12 +500,9 @@ class CPCApi(object):
             Depending on the `limit` parameter, returns a list of Parliamentarian objects with size `limit` or just
             one Parliamentarian object.
         """
-        # extractBests applies distortions on q to see if it can match some elements in parliamentarians
-        # based on their `field` attribute. It also returns a score to each result
-        # that tells how bad the distortion was to get that result.
-        extracted = extractBests(q, self.parlementarians(),
-                                 processor=lambda x: x.__dict__[field] if isinstance(x, Parliamentarian) else x,
-                                 limit=limit or 1)
+        # the query is preprocessed once, so that queries differing only by case or punctuation
+        # share the same memoized search
+        extracted = self._search_field(_process(q), field, limit)
         # extracted is a list of couples (Parliamentarian, score)
         if limit is None:
             if no_score:
@@ -258,19 +514,146 @@ class CPCApi(object):
         else:
             return extracted
 
+    def search_parliamentarians_batch(self, queries: List[str], field: str = 'nom', limit: int = None,
+                                      no_score: bool = True) -> List:
+        """
+        Finds the parliamentarians matching each query of `queries`, with the scorer of self.search_parliamentarians().
+
+        All the queries are compared at once to all the parliamentarians, on every CPU core.
+        This is much faster than calling self.search_parliamentarians() in a loop when there are many queries.
+        Every parliamentarian is ranked by its fuzzy score only, ties broken by position in the list of
+        parliamentarians: unlike self.search_parliamentarians(), exact substring matches are not ranked first, so
+        both functions may return different parliamentarians for the same query.
+
+        Parameters
+        ----------
+        queries: List[str]
+            Strings close to a substring of `field`.
+        field: str
+            A field (attribute) in the Parliamentarian objects returned by function self.parliamentarians().
+            (default: nom)
+        limit: Choice([int, None])
+             If None, return only the first parliamentarian. Number of parliamentarians to return. (default: None)
+        no_score: bool
+            If True: Do not return the score of each parliamentarian in the search function. (default: True)
+
+        Returns
+        -------
+        List[List[Parliamentarian]] or List[Parliamentarian]
+            For each query, a result formatted as the one of self.search_parliamentarians() with the same parameters.
+        """
+        parls = self.parlementarians()
+        choices = self._processed_field(field)
+        # matrix of the scores of each query (rows) against each parliamentarian (columns)
+        scores = cdist([_process(q) for q in queries], choices,
+                       scorer=fuzz.WRatio, processor=None, workers=-1)
+        # the stable sort keeps tied parliamentarians in the order of their position in the list
+        arr_best = np.argsort(-scores, axis=1, kind='stable')[:, :limit or 1]
+
+        results = []
+        for row_scores, row_best in zip(scores, arr_best):
+            extracted = [(parls[i], float(row_scores[i])) for i in row_best]
+            if no_score:
+                extracted = [elm[0] for elm in extracted]
+            results.append(extracted if limit is not None else extracted[0])
+        return results
+
+    @memoize
+    def _search_field(self, processed_q: str, field: str, limit: int = None) -> List:
+        """
+        Finds the parliamentarians whose preprocessed `field` attribute best match the preprocessed query.
+
+        Parameters
+        ----------
+        processed_q: str
+            The query, already preprocessed like the values of `field`.
+        field: str
+            A field (attribute) in the Parliamentarian objects returned by function self.parliamentarians().
+        limit: Choice([int, None])
+            Number of parliamentarians to return. If None, return only the best one.
+
+        Returns
+        -------
+        List[Tuple[Parliamentarian, float]]
+            The best parliamentarians with their score, from best to worst.
+        """
+        # the WRatio scorer applies distortions on q to see if it can match some elements in parliamentarians
+        # based on their `field` attribute. It gives a score to each result
+        # that tells how bad the distortion was to get that result.
+        parls = self.parlementarians()
+        choices = self._processed_field(field)
+        # fast path: if enough parliamentarians contain the query as is, they are returned without fuzzy scoring.
+        # Those where the query is a whole word come first, then those where it starts a word, then the others.
+        # Ties go to the shortest ones.
+        if processed_q:
+            matches = [i for i, choice in enumerate(choices) if processed_q in choice]
+            if len(matches) >= (limit or 1):
+                word, word_start = f' {processed_q} ', ' ' + processed_q
+
+                def rank(i):
+                    padded = f' {choices[i]} '
+                    return 0 if word in padded else 1 if word_start in padded else 2, len(choices[i])
+
+                matches.sort(key=rank)
+                return [(parls[i], fuzz.WRatio(processed_q, choices[i], processor=None))
+                        for i in matches[:limit or 1]]
+        # only the parliamentarians sharing the most bigrams with the query go through the expensive scorer,
+        # unless too few of them share a bigram with it to return `limit` results
+        index = self._ngram_index(field)
+        counts = Counter()
+        for bigram in _bigrams(processed_q):
+            counts.update(index.get(bigram, ()))
+        if len(counts) >= (limit or 1):
+            candidates = sorted(i for i, _ in counts.most_common(max(self.search_candidates, limit or 1)))
+            choices = {i: choices[i] for i in candidates}
+        # extractOne raises the score_cutoff given to the scorer to the best score seen so far as it goes.
+        # extract scores every candidate and keeps the `limit` best ones with a partial sort: raising its cutoff
+        # from a heap of the best results in Python was measured to be slower than this compiled loop.
+        if limit is None:
+            extracted = [extractOne(processed_q, choices, scorer=fuzz.WRatio, processor=None)]
+        else:
+            extracted = extract(processed_q, choices, scorer=fuzz.WRatio, processor=None, limit=limit)
+        # results are triplets (choice, score, index or key): map them back to the Parliamentarian objects
+        return [(parls[index], score) for _, score, index in extracted]
+
+
+def _process(string: str) -> str:
+    """
+    Returns `string` folded to ASCII, lowercased and stripped of non alphanumeric characters, for fuzzy matching.
+    """
+    return default_process(unicodedata.normalize('NFKD', string).encode('ascii', 'ignore').decode('ascii'))
+
+
+def _bigrams(string: str) -> set:
+    """
+    Returns the set of the pairs of consecutive characters in `string`.
+    """
+    return {string[i:i + 2] for i in range(len(string) - 1)}
+
 
 class Vote:
     """
     Vote class.
     """
+    # attributes read from the json data of the API, missing ones are set to None
+    fields = ('position', 'position_groupe', 'par_delegation', 'mise_au_point_position',
+              'parlementaire_groupe_acronyme', 'parlementaire_slug')
+    __slots__ = fields + ('balloting', 'number_vote')
+
     def __init__(self, dct_vote, balloting):
-        self.__dict__.update(dct_vote)  # todo explicit attributes: sqlalchemy
+        for field in self.fields:  # todo explicit attributes: sqlalchemy
+            setattr(self, field, dct_vote.get(field))
         self.balloting = balloting
         self.number_vote = self.balloting.numero
         self.balloting.add_vote(self)
 
     def __hash__(self):
-        return hash(f"{self.number_vote}{self.parlementaire_slug}")
+        return hash((self.number_vote, self.parlementaire_slug))
+
+    def __eq__(self, other):
+        if not isinstance(other, Vote):
+            return NotImplemented
+        return (self.number_vote, self.parlementaire_slug) == (other.number_vote, other.parlementaire_slug)
 
     def __repr__(self):
         return f"<{self.__class__.__name__}: ({self.number_vote}) {self.parlementaire_slug} [{self.position}]>"
@@ -278,22 +661,30 @@ class Vote:
 
 class Balloting:
     """
-    Balloting class contains a set of votes. It correspond to the pull of all votes made by all parliamentarian
-    who voted at a single balloting.
+    Balloting class contains the votes by parliamentarian slug. It correspond to the pull of all votes made by all
+    parliamentarian who voted at a single balloting.
     """
+    # attributes read from the json data of the API, missing ones are set to None
+    fields = ('numero', 'seance', 'date', 'type', 'sort', 'titre', 'nombre_votants', 'nombre_pours',
+              'nombre_contres', 'nombre_abstentions', 'demandeurs', 'demandeurs_groupes_acronymes',
+              'url_institution', 'url_nosdeputes', 'url_nosdeputes_api')
+    __slots__ = fields + ('votes_by_slug',)
+
     def __init__(self, dct_balloting):
         """ salut """
-        self.__dict__.update(dct_balloting)  # todo explicit attributes: sqlalchemy
-        self.set_votes = set()
+        for field in self.fields:  # todo explicit attributes: sqlalchemy
+            setattr(self, field, dct_balloting.get(field))
+        self.votes_by_slug = dict()
 
     def add_vote(self, vote: Vote):
         """
-        Add Vote object to the set of votes in balloting. Each vote can appear only once.
+        Add Vote object to the votes in balloting, indexed by the slug of the parliamentarian.
+        Each parliamentarian can vote only once.
 
         :param vote: Vote object.
         :return: None
         """
-        self.set_votes.add(vote)
+        self.votes_by_slug[vote.parlementaire_slug] = vote
 
     def __repr__(self):
         """ salut """
@@ -305,8 +696,19 @@ class Parliamentarian:
     """
     Parliamentarian interfaces CPCApi
     """
+    # attributes read from the json data of the API (deputies and senators), missing ones are set to None
+    fields = ('id', 'nom', 'nom_de_famille', 'prenom', 'sexe', 'date_naissance', 'lieu_naissance', 'date_deces',
+              'num_deptmt', 'nom_circo', 'num_circo', 'mandat_debut', 'mandat_fin', 'ancien_depute',
+              'ancien_senateur', 'groupe_sigle', 'groupe', 'parti_ratt_financier', 'sites_web', 'emails',
+              'adresses', 'collaborateurs', 'autres_mandats', 'anciens_autres_mandats', 'anciens_mandats',
+              'responsabilites', 'responsabilites_extra_parlementaires', 'profession', 'place_en_hemicycle',
+              'url_an', 'id_an', 'url_institution', 'id_institution', 'slug', 'url_nosdeputes',
+              'url_nosdeputes_api', 'url_nossenateurs', 'url_nossenateurs_api', 'nb_mandats', 'twitter')
+    __slots__ = fields + ('api',)
+
     def __init__(self, dict_parl, api: CPCApi):
-        self.__dict__.update(dict_parl)  # todo explicit attributes: sqlalchemy
+        for field in self.fields:  # todo explicit attributes: sqlalchemy
+            setattr(self, field, dict_parl.get(field))
         self.api = api
 
     def get_votes(self):
@@ -319,4 +721,32 @@ class Parliamentarian:
 
     def __repr__(self):
         str_repr = f"<{self.__class__.__name__}: {self.nom} {self.groupe_sigle} {self.nom_circo}({self.num_circo}); ID={self.id_an}>"
-        return str_repr
\ No newline at end of file
+        return str_repr
+
+
+class _LazyParliamentarians(Sequence):
+    """
+    Read-only list of Parliamentarian objects created from their json data the first time they are accessed.
+    """
+    def __init__(self, lst_dict_parl, api: CPCApi):
+        self.lst_dict_parl = lst_dict_parl
+        self.api = api
+        self._lst_parl = [None] * len(lst_dict_parl)
+
+    def __len__(self):
+        return len(self.lst_dict_parl)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        parl = self._lst_parl[index]
+        if parl is None:
+            parl = self._lst_parl[index] = Parliamentarian(self.lst_dict_parl[index], self.api)
+        return parl
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self):
+        return repr(list(self))
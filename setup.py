@@ -47,5 +47,5 @@ setup(
 
     packages=['cpc_api'],
 
-    install_requires=['requests', 'fuzzywuzzy', 'matplotlib', 'imageio', 'numpy'],
+    install_requires=['requests', 'requests-cache', 'orjson', 'aiohttp', 'rapidfuzz', 'matplotlib', 'imageio', 'numpy'],
 )
\ No newline at end of file
@@ -1,6 +1,10 @@
 # -*- coding: utf-8 -*-
 
 import unittest
+from unittest import mock
+
+import aiohttp
+import requests_cache
 
 from cpc_api import CPCApi
 
@@ -27,11 +31,33 @@ class SearchQuestionServiceTest(unittest.TestCase):
         self.assertGreater(len(parlementaires), 1)
         self.assertEqual(api.search_parliamentarians('Melenchon').nom_de_famille, u'Mélenchon')
 
+    def test_search_batch(self):
+        api = CPCApi(legislature='2017-2022')
+        results = api.search_parliamentarians_batch(['Melenchon', 'Larcher'], limit=3)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0][0].nom_de_famille, u'Mélenchon')
+        self.assertEqual(len(results[1]), 3)
+
     def test_search(self):
         api = CPCApi(legislature='2017-2022')
         result = api.search("Melenchon")
         self.assertEqual(len(result), 4)
 
+    def test_memoize_shared_between_instances(self):
+        api = CPCApi(legislature='2017-2022')
+        self.assertIs(api.parlementarians(), CPCApi(legislature='2017-2022').parlementarians())
+        self.assertIsNot(api.parlementarians(), CPCApi(legislature='2012-2017').parlementarians())
+
+    def test_memoize_distinct_methods(self):
+        api = CPCApi(legislature='2017-2022')
+        api.search_parliamentarians('Melenchon')
+        self.assertIsInstance(api.search('Melenchon'), dict)
+
+    def test_session_shared_between_instances(self):
+        api = CPCApi(legislature='2017-2022')
+        self.assertIs(api.session, CPCApi(ptype='senateur').session)
+        self.assertIsNot(api.session, CPCApi(legislature='2017-2022', expire_after=None).session)
+
 
 class ParliamentarianTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -42,3 +68,89 @@ class ParliamentarianTest(unittest.TestCase):
         for parl in self.parlementarians[:10]:
             _ = parl.get_votes()
         print(len(self.api.dct_all_ballotings))
+
+    def test_get_votes_bulk(self):
+        # these votes are not requested by the other tests, so they are not memoized yet
+        slugs = [parl.slug for parl in self.parlementarians[30:40]]
+        with mock.patch.object(aiohttp.ClientSession, 'get', autospec=True,
+                               side_effect=aiohttp.ClientSession.get) as get:
+            dct_votes = self.api.parliamentarians_votes_bulk(slugs)
+        self.assertEqual(get.call_count, len(slugs))
+        self.assertEqual(set(dct_votes), set(slugs))
+        self.assertIs(self.api.parliamentarian_votes(slugs[0]), dct_votes[slugs[0]])
+
+    def test_prefetch_votes(self):
+        slugs = [parl.slug for parl in self.parlementarians[10:20]]
+        self.api.prefetch_votes(slugs)
+        for parl in self.parlementarians[10:20]:
+            self.assertGreater(len(parl.get_votes()), 0)
+
+    def test_prefetch_votes_other_instance(self):
+        # the Parliamentarian objects are shared with the instance that first requested them
+        api = CPCApi(legislature='2017-2022')
+        slugs = [parl.slug for parl in self.parlementarians[20:30]]
+        with mock.patch.object(requests_cache.CachedSession, 'request', autospec=True,
+                               side_effect=requests_cache.CachedSession.request) as request:
+            api.prefetch_votes(slugs)
+            for parl in self.parlementarians[20:30]:
+                _ = parl.get_votes()
+        self.assertEqual(request.call_count, len(slugs))
+        self.assertFalse(set(slugs) & set(api._votes_data))
+
+
+class OfflineTest(unittest.TestCase):
+    # the website is not requested: the parliamentarians come from a small fixed payload
+    names = ['Martine Wonner', 'Philippe Martin', 'Paul Molac', 'Jean-Paul Lecoq']
+
+    def setUp(self) -> None:
+        payload = {'deputes': [{'depute': {'nom': name, 'slug': name.lower().replace(' ', '-')}}
+                               for name in self.names]}
+        patchers = [mock.patch.object(CPCApi, '_get_json', return_value=payload)]
+        # the memoized results and the per-website stores of the other tests are hidden during these ones
+        patchers += [mock.patch.dict(dct, clear=True) for dct in (CPCApi.cache, CPCApi._ballotings_by_base_url,
+                                                                  CPCApi._votes_data_by_base_url,
+                                                                  CPCApi._search_data_by_base_url)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.api = CPCApi(legislature='2017-2022')
+
+    def test_search_whole_word_first(self):
+        self.assertEqual(self.api.search_parliamentarians('Martin').nom, 'Philippe Martin')
+        self.assertEqual([parl.nom for parl in self.api.search_parliamentarians('Martin', limit=2)],
+                         ['Philippe Martin', 'Martine Wonner'])
+
+    def test_search_word_start_first(self):
+        self.assertEqual([parl.nom for parl in self.api.search_parliamentarians('Paul', limit=2)],
+                         ['Paul Molac', 'Jean-Paul Lecoq'])
+        self.assertEqual(self.api.search_parliamentarians('ppe').nom, 'Philippe Martin')
+
+    def test_search_not_enough_substring_matches(self):
+        parls = self.api.search_parliamentarians('Martin', limit=3)
+        self.assertEqual(len(parls), 3)
+        self.assertEqual({parl.nom for parl in parls[:2]}, {'Philippe Martin', 'Martine Wonner'})
+
+    def test_search_not_enough_bigram_matches(self):
+        # only 'Martine Wonner' contains the bigram 'wo': the others are scored too to return 3 results
+        parls = self.api.search_parliamentarians('wo', limit=3)
+        self.assertEqual(len(parls), 3)
+        self.assertEqual(parls[0].nom, 'Martine Wonner')
+
+    def test_search_no_bigram(self):
+        self.assertEqual(len(self.api.search_parliamentarians('z', limit=2)), 2)
+        self.assertIn(self.api.search_parliamentarians('z').nom, self.names)
+
+    def test_lazy_parlementarians(self):
+        parls = self.api.parlementarians()
+        self.assertEqual(len(parls), len(self.names))
+        # counting doesn't create any Parliamentarian object
+        self.assertEqual(parls._lst_parl, [None] * len(self.names))
+        self.assertEqual(parls[1].nom, 'Philippe Martin')
+        self.assertIs(parls[1], parls[1])
+        self.assertIs(parls[-3], parls[1])
+        self.assertEqual(sum(parl is not None for parl in parls._lst_parl), 1)
+        self.assertIsInstance(parls[1:3], list)
+        self.assertEqual([parl.nom for parl in parls[1:3]], self.names[1:3])
+        self.assertIs(parls[1:3][0], parls[1])
+        self.assertEqual([parl.nom for parl in parls], self.names)
+        self.assertEqual(list(parls), parls[:])